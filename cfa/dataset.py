@@ -2,18 +2,42 @@ import os
 import csv
 import json
 import random
+import bisect
 import datetime
-import uuid
+import contextlib
+import functools
+import gzip
+import heapq
+import io
+import itertools
+import pickle
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from faker import Faker
 
-# Initialize faker for generating realistic data
-fake = Faker()
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:  # fall back to csv.writer (and CSV transactions)
+    pa = None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_faker():
+    """Return the shared Faker instance"""
+    return Faker()
+
+
+# Initialize faker for generating realistic data. Always go through this shared
+# instance: constructing a new Faker() per row repeats the provider setup every time.
+fake = _get_faker()
 
 # Get project root path
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = os.path.join(PROJECT_ROOT, "data", "raw")
+INTERIM_DIR = os.path.join(PROJECT_ROOT, "data", "interim")
 
 # Configuration
 NUM_CONTRACTS = 500  # Number of contracts
@@ -22,18 +46,51 @@ NUM_PROJECTS = 50  # Number of projects
 NUM_TRANSACTIONS = 50000  # Number of financial transactions
 NUM_MODIFICATIONS = 2000  # Number of contract modifications
 NUM_DELIVERABLES = 5000  # Number of contract deliverables
+NUM_TRANSACTION_SHARDS = 8  # Transactions are generated in this many parallel shards
+TRANSACTIONS_FORMAT = "parquet"  # "parquet" or "csv"; CSV is always used without pyarrow
+PRETTY_JSON = False  # Indent vendors.json for reading by eye (slower, larger file)
 
 # File paths
 CONTRACTS_FILE = os.path.join(DATA_DIR, "contracts.csv")
 VENDORS_FILE = os.path.join(DATA_DIR, "vendors.json")
 PROJECTS_FILE = os.path.join(DATA_DIR, "projects.csv")
-TRANSACTIONS_FILE = os.path.join(DATA_DIR, "transactions.csv")
-MODIFICATIONS_FILE = os.path.join(DATA_DIR, "contract_modifications.csv")
-DELIVERABLES_FILE = os.path.join(DATA_DIR, "deliverables.csv")
+TRANSACTIONS_FILE = os.path.join(DATA_DIR, "transactions.csv.gz")
+TRANSACTIONS_PARQUET_FILE = os.path.join(DATA_DIR, "transactions.parquet")
+MODIFICATIONS_FILE = os.path.join(DATA_DIR, "contract_modifications.csv.gz")
+DELIVERABLES_FILE = os.path.join(DATA_DIR, "deliverables.csv.gz")
 PERSONNEL_FILE = os.path.join(DATA_DIR, "personnel.csv")
 
-# Ensure data directory exists
+# contract_id -> (start_ord, end_ord, current_value), shared with the stage 2 workers
+CONTRACT_INDEX_FILE = os.path.join(INTERIM_DIR, "contract_index.pkl")
+
+# Per-shard transaction files (by shard index and extension), merged into the transactions
+# file once all shards are done
+TRANSACTION_SHARD_FILE = os.path.join(INTERIM_DIR, "transactions_{:03d}.{}")
+
+# Number of distinct Faker strings generated for free-text columns that are sampled rather
+# than generated per row (transaction descriptions, deliverable titles and descriptions)
+FAKER_POOL_SIZE = 2000
+
+# Ordinal of 1970-01-01, for converting date ordinals to numpy datetime64[D]
+EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+
+# Fiscal quarter and fiscal-year offset by calendar month (index 0 unused), assuming an
+# Oct 1 fiscal year start: Oct-Dec is Q1 of the same year, Jan-Sep belongs to the prior year
+FQ_TABLE = np.array([0, 2, 2, 2, 3, 3, 3, 4, 4, 4, 1, 1, 1], dtype=np.int8)
+FY_OFFSET = np.array([0, -1, -1, -1, -1, -1, -1, -1, -1, -1, 0, 0, 0], dtype=np.int8)
+
+# CSV writing: rows are handed to csv.writer in batches through a large file buffer
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_BATCH_SIZE = 1024
+ARROW_CSV_BATCH_SIZE = 8192
+
+# Outputs whose path ends in .gz are gzip-compressed at this level (1 is fast and still
+# shrinks CSV several times over)
+GZIP_COMPRESSLEVEL = 1
+
+# Ensure data directories exist
 os.makedirs(DATA_DIR, exist_ok=True)
+os.makedirs(INTERIM_DIR, exist_ok=True)
 
 # Constants for data generation
 CONTRACT_TYPES = [
@@ -94,6 +151,70 @@ DELIVERABLE_TYPES = [
     "Data",
 ]
 
+VENDOR_SIZES = ["Small", "Medium", "Large", "Very Large"]
+
+VENDOR_CATEGORIES = [
+    "IT Services",
+    "Hardware",
+    "Software",
+    "Engineering",
+    "R&D",
+    "Professional Services",
+    "Manufacturing",
+    "Logistics",
+    "Consulting",
+    "Training",
+    "Facilities",
+    "Security",
+    "Telecommunications",
+]
+
+SOCIOECONOMIC_CATEGORIES = ["8(a)", "SDVOSB", "WOSB", "HUBZone", "SB", "LB"]
+
+PROJECT_PRIORITIES = ["Low", "Medium", "High", "Critical"]
+
+SECURITY_CLEARANCES = ["Secret", "Top Secret", "TS/SCI", "Confidential", "Public Trust"]
+
+# Contract current/original value modifiers and their probabilities, for the vectorized draw
+VALUE_MODIFIERS = [0.8, 0.9, 1.0, 1.1, 1.2, 1.5]
+VALUE_MODIFIER_WEIGHTS = np.array([5, 15, 50, 20, 8, 2])
+VALUE_MODIFIER_P = VALUE_MODIFIER_WEIGHTS / VALUE_MODIFIER_WEIGHTS.sum()
+
+# Cumulative weights for the scalar weighted draws, built once instead of on every row
+START_YEARS = list(range(2018, 2025))
+START_YEAR_CUM = tuple(itertools.accumulate([1, 2, 3, 5, 7, 10, 15]))
+
+CONTRACT_DURATIONS = [1, 2, 3, 4, 5]
+DURATION_CUM = tuple(itertools.accumulate([40, 30, 15, 10, 5]))
+
+STATUS_CUM = tuple(itertools.accumulate([60, 25, 5, 5, 5]))
+
+DELIVERY_OFFSETS = [-10, -5, 0, 3, 7, 15, 30]
+DELIVERY_OFFSET_CUM = tuple(itertools.accumulate([5, 10, 60, 10, 8, 5, 2]))
+
+ACCEPTANCE_OPTIONS = ["Yes", "No", "Conditional"]
+ACCEPTANCE_CUM = tuple(itertools.accumulate([80, 15, 5]))
+
+
+def _weighted_choice(options, cum_weights):
+    """Pick one of options using precomputed cumulative weights"""
+    return options[bisect.bisect(cum_weights, random.random() * cum_weights[-1])]
+
+
+def _seed_generators(seed):
+    """Seed random and Faker from seed and return a matching numpy Generator"""
+    rng = np.random.default_rng(seed)
+    if seed is not None:
+        random.seed(int(rng.integers(2**63)))
+        fake.seed_instance(int(rng.integers(2**63)))
+    return rng
+
+
+def _faker_pool(provider, **kwargs):
+    """Pre-generate FAKER_POOL_SIZE strings from a Faker provider to sample flavor text from"""
+    return np.array([provider(**kwargs) for _ in range(FAKER_POOL_SIZE)])
+
+
 # Generate IDs first
 contract_ids = [f"CTR-{i:06d}" for i in range(1, NUM_CONTRACTS + 1)]
 vendor_ids = [f"VEN-{i:04d}" for i in range(1, NUM_VENDORS + 1)]
@@ -104,13 +225,43 @@ personnel_ids = [f"PER-{i:05d}" for i in range(1, 1000 + 1)]  # 1000 personnel
 contract_to_vendor = {}
 contract_to_project = {}
 contract_values = {}
+contract_dates = {}
+
+
+def _load_contract_index():
+    """Load the contract dates and values written by generate_contracts"""
+    with open(CONTRACT_INDEX_FILE, "rb") as f:
+        contract_index = pickle.load(f)
 
+    for contract_id, (start_ord, end_ord, current_value) in contract_index.items():
+        contract_dates[contract_id] = (start_ord, end_ord)
+        contract_values[contract_id] = current_value
 
-def generate_contracts():
+
+def generate_contracts(seed=None):
     """Generate contract data"""
     print("Generating contract data...")
 
-    with open(CONTRACTS_FILE, "w", newline="") as csvfile:
+    rng = _seed_generators(seed)
+
+    # Draw the per-contract columns up front in single vectorized calls
+    vendor_col = rng.choice(vendor_ids, size=NUM_CONTRACTS)
+    project_col = rng.choice(project_ids, size=NUM_CONTRACTS)
+    contract_type_col = rng.choice(CONTRACT_TYPES, size=NUM_CONTRACTS)
+
+    # Generate contract values, typically between $100K and $50M
+    original_values = rng.uniform(100000, 50000000, size=NUM_CONTRACTS).round(2)
+
+    # Current value might be different from original due to modifications
+    # Weighted to have some overruns, some underruns, and many on target
+    modifiers = rng.choice(VALUE_MODIFIERS, p=VALUE_MODIFIER_P, size=NUM_CONTRACTS)
+    current_values = (original_values * modifiers).round(2)
+
+    # Format the money columns in one call each rather than per row
+    original_value_strs = np.char.mod("%.2f", original_values)
+    current_value_strs = np.char.mod("%.2f", current_values)
+
+    with open(CONTRACTS_FILE, "w", newline="", buffering=WRITE_BUFFER_SIZE) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(
             [
@@ -130,108 +281,91 @@ def generate_contracts():
             ]
         )
 
-        start_years = list(range(2018, 2025))
+        batch = []
 
-        for contract_id in contract_ids:
+        for i, contract_id in enumerate(contract_ids):
             contract_number = f"N00{random.randint(10000, 99999)}-{random.randint(10, 99)}-D-{random.randint(1000, 9999)}"
-            vendor_id = random.choice(vendor_ids)
-            project_id = random.choice(project_ids)
-            contract_type = random.choice(CONTRACT_TYPES)
+            vendor_id = str(vendor_col[i])
+            project_id = str(project_col[i])
+            contract_type = contract_type_col[i]
 
             # Store relationships for later use
             contract_to_vendor[contract_id] = vendor_id
             contract_to_project[contract_id] = project_id
 
             # Generate dates with majority being recent but some older contracts
-            start_year = random.choices(start_years, weights=[1, 2, 3, 5, 7, 10, 15], k=1)[0]
-            start_date_obj = datetime.date(start_year, 1, 1)
-            end_date_obj = datetime.date(start_year, 12, 31)
-            start_date = fake.date_between(start_date=start_date_obj, end_date=end_date_obj)
+            start_year = _weighted_choice(START_YEARS, START_YEAR_CUM)
+            start_ord = random.randint(
+                datetime.date(start_year, 1, 1).toordinal(),
+                datetime.date(start_year, 12, 31).toordinal(),
+            )
 
             # Contract duration between 1 and 5 years, weighted toward shorter
-            duration_years = random.choices([1, 2, 3, 4, 5], weights=[40, 30, 15, 10, 5], k=1)[0]
-            end_date = start_date + datetime.timedelta(days=365 * duration_years)
-
-            # Generate contract values, typically between $100K and $50M
-            original_value = round(random.uniform(100000, 50000000), 2)
-
-            # Current value might be different from original due to modifications
-            # Weighted to have some overruns, some underruns, and many on target
-            modifier = random.choices(
-                [0.8, 0.9, 1.0, 1.1, 1.2, 1.5], weights=[5, 15, 50, 20, 8, 2], k=1
-            )[0]
-            current_value = round(original_value * modifier, 2)
+            duration_years = _weighted_choice(CONTRACT_DURATIONS, DURATION_CUM)
+            end_ord = start_ord + 365 * duration_years
 
             # Store for later reference
-            contract_values[contract_id] = current_value
+            contract_values[contract_id] = float(current_values[i])
+            contract_dates[contract_id] = (start_ord, end_ord)
 
             # Status weighted toward active
-            status = random.choices(CONTRACT_STATUS, weights=[60, 25, 5, 5, 5], k=1)[0]
+            status = _weighted_choice(CONTRACT_STATUS, STATUS_CUM)
             department = random.choice(DEPARTMENTS)
             description = fake.bs()  # Business jargon for description
-            contracting_officer = personnel_ids[random.randint(0, len(personnel_ids) - 1)]
+            contracting_officer = random.choice(personnel_ids)
 
-            writer.writerow(
+            batch.append(
                 [
                     contract_id,
                     contract_number,
                     vendor_id,
                     project_id,
                     contract_type,
-                    start_date.strftime("%Y-%m-%d"),
-                    end_date.strftime("%Y-%m-%d"),
-                    f"{original_value:.2f}",
-                    f"{current_value:.2f}",
+                    datetime.date.fromordinal(start_ord).isoformat(),
+                    datetime.date.fromordinal(end_ord).isoformat(),
+                    original_value_strs[i],
+                    current_value_strs[i],
                     status,
                     department,
                     description,
                     contracting_officer,
                 ]
             )
+            if len(batch) >= WRITE_BATCH_SIZE:
+                writer.writerows(batch)
+                batch.clear()
+
+        writer.writerows(batch)
+
+    contract_index = {
+        contract_id: (*contract_dates[contract_id], contract_values[contract_id])
+        for contract_id in contract_ids
+    }
+    with open(CONTRACT_INDEX_FILE, "wb") as f:
+        pickle.dump(contract_index, f)
 
     print(f"✅ Generated {NUM_CONTRACTS} contracts")
 
 
-def generate_vendors():
-    """Generate vendor data"""
+def generate_vendors(seed=None, pretty_json=None):
+    """Generate vendor data, indenting vendors.json if pretty_json (default PRETTY_JSON)"""
     print("Generating vendor data...")
 
+    if pretty_json is None:
+        pretty_json = PRETTY_JSON
+
+    _seed_generators(seed)
+
     vendors = []
     for vendor_id in vendor_ids:
-        vendor_size = random.choice(["Small", "Medium", "Large", "Very Large"])
+        vendor_size = random.choice(VENDOR_SIZES)
 
         # Generate some realistic procurement categories
-        categories = random.sample(
-            [
-                "IT Services",
-                "Hardware",
-                "Software",
-                "Engineering",
-                "R&D",
-                "Professional Services",
-                "Manufacturing",
-                "Logistics",
-                "Consulting",
-                "Training",
-                "Facilities",
-                "Security",
-                "Telecommunications",
-            ],
-            k=random.randint(1, 5),
-        )
+        categories = random.sample(VENDOR_CATEGORIES, k=random.randint(1, 5))
 
         # Financial metrics
         annual_revenue = round(random.uniform(1000000, 5000000000), 2)
 
-        # Contract history - some metrics about past performance
-        past_performance = {
-            "on_time_delivery_rate": round(random.uniform(0.7, 1.0), 2),
-            "quality_rating": round(random.uniform(3.0, 5.0), 1),
-            "cost_variance": round(random.uniform(-0.2, 0.3), 2),  # negative is under budget
-            "contracts_completed": random.randint(5, 200),
-            "avg_contract_value": round(random.uniform(100000, 10000000), 2),
-        }
-
         vendor = {
             "vendor_id": vendor_id,
             "name": fake.company(),
@@ -246,33 +380,43 @@ def generate_vendors():
             "website": fake.url(),
             "size": vendor_size,
             "categories": categories,
-            "socioeconomic": random.sample(
-                ["8(a)", "SDVOSB", "WOSB", "HUBZone", "SB", "LB"], k=random.randint(0, 3)
-            ),
+            "socioeconomic": random.sample(SOCIOECONOMIC_CATEGORIES, k=random.randint(0, 3)),
             "annual_revenue": annual_revenue,
             "year_established": random.randint(1950, 2020),
-            "past_performance": past_performance,
+            # Contract history - some metrics about past performance (pp_*)
+            "pp_on_time_delivery_rate": round(random.uniform(0.7, 1.0), 2),
+            "pp_quality_rating": round(random.uniform(3.0, 5.0), 1),
+            "pp_cost_variance": round(random.uniform(-0.2, 0.3), 2),  # negative is under budget
+            "pp_contracts_completed": random.randint(5, 200),
+            "pp_avg_contract_value": round(random.uniform(100000, 10000000), 2),
             "active_contracts": random.randint(1, 30),
-            "point_of_contact": {
-                "name": fake.name(),
-                "title": fake.job(),
-                "phone": fake.phone_number(),
-                "email": fake.email(),
-            },
+            # Point of contact (poc_*)
+            "poc_name": fake.name(),
+            "poc_title": fake.job(),
+            "poc_phone": fake.phone_number(),
+            "poc_email": fake.email(),
         }
         vendors.append(vendor)
 
     with open(VENDORS_FILE, "w") as f:
-        json.dump(vendors, f, indent=2)
+        if pretty_json:
+            json.dump(vendors, f, indent=2)
+        else:
+            json.dump(vendors, f, separators=(",", ":"))
 
     print(f"✅ Generated {NUM_VENDORS} vendors")
 
 
-def generate_projects():
+def generate_projects(seed=None):
     """Generate project data"""
     print("Generating project data...")
 
-    with open(PROJECTS_FILE, "w", newline="") as csvfile:
+    rng = _seed_generators(seed)
+
+    # Budget - large programs can be hundreds of millions
+    total_budgets = np.char.mod("%.2f", rng.uniform(5000000, 500000000, size=NUM_PROJECTS))
+
+    with open(PROJECTS_FILE, "w", newline="", buffering=WRITE_BUFFER_SIZE) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(
             [
@@ -289,147 +433,312 @@ def generate_projects():
             ]
         )
 
-        for project_id in project_ids:
+        batch = []
+
+        for i, project_id in enumerate(project_ids):
             name = f"Project {fake.catch_phrase()}"
             project_type = random.choice(PROJECT_TYPES)
             description = fake.paragraph(nb_sentences=3)
 
             # Project dates - typically 2-7 years
             start_year = random.randint(2015, 2022)
-            start_date_obj = datetime.date(start_year, 1, 1)
-            end_date_obj = datetime.date(start_year, 12, 31)
-            start_date = fake.date_between(start_date=start_date_obj, end_date=end_date_obj)
+            start_ord = random.randint(
+                datetime.date(start_year, 1, 1).toordinal(),
+                datetime.date(start_year, 12, 31).toordinal(),
+            )
             duration_years = random.randint(2, 7)
-            end_date = start_date + datetime.timedelta(days=365 * duration_years)
+            end_ord = start_ord + 365 * duration_years
 
-            # Budget - large programs can be hundreds of millions
-            total_budget = round(random.uniform(5000000, 500000000), 2)
             department = random.choice(DEPARTMENTS)
-            program_manager = personnel_ids[random.randint(0, len(personnel_ids) - 1)]
-            priority = random.choice(["Low", "Medium", "High", "Critical"])
+            program_manager = random.choice(personnel_ids)
+            priority = random.choice(PROJECT_PRIORITIES)
 
-            writer.writerow(
+            batch.append(
                 [
                     project_id,
                     name,
                     project_type,
                     description,
-                    start_date.strftime("%Y-%m-%d"),
-                    end_date.strftime("%Y-%m-%d"),
-                    f"{total_budget:.2f}",
+                    datetime.date.fromordinal(start_ord).isoformat(),
+                    datetime.date.fromordinal(end_ord).isoformat(),
+                    total_budgets[i],
                     department,
                     program_manager,
                     priority,
                 ]
             )
+            if len(batch) >= WRITE_BATCH_SIZE:
+                writer.writerows(batch)
+                batch.clear()
+
+        writer.writerows(batch)
 
     print(f"✅ Generated {NUM_PROJECTS} projects")
 
 
-def generate_transactions():
-    """Generate financial transaction data"""
-    print("Generating transaction data...")
+def _contract_columns():
+    """Return contract values and start/end date ordinals as arrays aligned with contract_ids"""
+    contract_values_arr = np.array([contract_values[c] for c in contract_ids])
+    start_ords_arr = np.array([contract_dates[c][0] for c in contract_ids])
+    end_ords_arr = np.array([contract_dates[c][1] for c in contract_ids])
+    return contract_values_arr, start_ords_arr, end_ords_arr
+
+
+def _compute_transaction_numerics(start_ords, end_ords, contract_values_arr, u1, u2):
+    """Compute transaction dates, amounts and fiscal periods from pre-drawn uniforms
+
+    All arguments are equal-length arrays; dates go in as proleptic Gregorian
+    ordinals and come back as datetime64[D].
+    """
+    # Transaction date within the contract period
+    tx_ords = start_ords + (u1 * (end_ords - start_ords + 1)).astype(np.int64)
+    tx_dates = (tx_ords - EPOCH_ORDINAL).astype("datetime64[D]")
+
+    # Transaction amount based on contract value, max 10% of contract in one transaction
+    amounts = (1000 + u2 * (contract_values_arr * 0.1 - 1000)).round(2)
+
+    # Fiscal year and quarter (assuming Oct 1 start)
+    years = tx_dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = tx_dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    fiscal_years = years + FY_OFFSET[months]
+    fiscal_quarters = FQ_TABLE[months]
+
+    return tx_dates, amounts, fiscal_years, fiscal_quarters
+
+
+def _open_output(path, binary=False):
+    """Open path for writing, gzip-compressing it when it ends in .gz"""
+    if path.endswith(".gz"):
+        # mtime=0 keeps the gzip header, and so seeded output, byte-for-byte reproducible
+        f = gzip.GzipFile(path, "wb", compresslevel=GZIP_COMPRESSLEVEL, mtime=0)
+        return f if binary else io.TextIOWrapper(f, newline="")
+
+    if binary:
+        return open(path, "wb", buffering=WRITE_BUFFER_SIZE)
+    return open(path, "w", newline="", buffering=WRITE_BUFFER_SIZE)
+
+
+def _write_csv_chunks(path, chunks):
+    """Write an iterable of {column: array} chunks to a single CSV file
+
+    Uses pyarrow's C++ CSV writer when pyarrow is installed and csv.writer otherwise.
+    """
+    if pa is not None:
+        sink = writer = None
+        for columns in chunks:
+            table = pa.table(columns)
+            if writer is None:
+                sink = _open_output(path, binary=True)
+                writer = pa_csv.CSVWriter(
+                    sink,
+                    table.schema,
+                    write_options=pa_csv.WriteOptions(batch_size=ARROW_CSV_BATCH_SIZE),
+                )
+            writer.write_table(table)
+        if writer is not None:
+            writer.close()
+            sink.close()
+        return
+
+    with _open_output(path) as csvfile:
+        writer = csv.writer(csvfile)
+        for i, columns in enumerate(chunks):
+            if i == 0:
+                writer.writerow(columns)
+            writer.writerows(zip(*columns.values()))
+
+
+def _write_parquet_chunks(path, chunks):
+    """Write an iterable of {column: array} chunks or tables to one snappy Parquet file"""
+    writer = None
+    for columns in chunks:
+        # pa.table only accepts a Table from pyarrow 14 on
+        table = columns if isinstance(columns, pa.Table) else pa.table(columns)
+        if writer is None:
+            writer = pq.ParquetWriter(path, table.schema, compression="snappy")
+        writer.write_table(table)
+    if writer is not None:
+        writer.close()
+
+
+def _transactions_as_parquet():
+    """Whether transactions are written as Parquet rather than CSV"""
+    return TRANSACTIONS_FORMAT == "parquet" and pa is not None
+
+
+def generate_transaction_shard(
+    shard_idx, transaction_nums, contract_idx, description_pool, as_parquet, seed=None
+):
+    """Generate one shard of the financial transaction data
+
+    The shard writes the transactions numbered transaction_nums (in increasing order) for
+    the contracts at contract_idx, which the planner drew for them, and samples descriptions
+    from description_pool. It writes Parquet if as_parquet is set and CSV otherwise.
+    Returns the path of the shard file; an empty shard still writes the header or schema.
+    """
+    rng = _seed_generators(seed)
+    _load_contract_index()
+    contract_ids_arr = np.array(contract_ids)
+    personnel_ids_arr = np.array(personnel_ids)
+    contract_values_arr, start_ords_arr, end_ords_arr = _contract_columns()
+    num_transactions = len(transaction_nums)
 
     # Generate in chunks to avoid memory issues
     chunk_size = 10000
-    num_chunks = (NUM_TRANSACTIONS + chunk_size - 1) // chunk_size
 
-    with open(TRANSACTIONS_FILE, "w", newline="") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(
-            [
-                "transaction_id",
-                "contract_id",
-                "transaction_date",
-                "amount",
-                "type",
-                "description",
-                "fiscal_year",
-                "fiscal_quarter",
-                "invoice_number",
-                "approved_by",
-            ]
-        )
+    def transaction_chunks():
+        # Yield at least one (possibly empty) chunk so the file gets its header or schema
+        for chunk_start in range(0, max(num_transactions, 1), chunk_size):
+            chunk_end = chunk_start + chunk_size
+            chunk_nums = transaction_nums[chunk_start:chunk_end]
+            chunk_contract_idx = contract_idx[chunk_start:chunk_end]
+            chunk_transactions = len(chunk_nums)
+
+            # Draw the random columns for the whole chunk at once
+            transaction_dates, amounts, fiscal_years, fiscal_quarters = (
+                _compute_transaction_numerics(
+                    start_ords_arr[chunk_contract_idx],
+                    end_ords_arr[chunk_contract_idx],
+                    contract_values_arr[chunk_contract_idx],
+                    rng.random(size=chunk_transactions),
+                    rng.random(size=chunk_transactions),
+                )
+            )
+            invoice_numbers = rng.integers(10000, 100000, size=chunk_transactions)
+
+            yield {
+                "transaction_id": np.char.mod("TXN-%08d", chunk_nums),
+                "contract_id": contract_ids_arr[chunk_contract_idx],
+                "transaction_date": transaction_dates,
+                "amount": amounts,
+                "type": rng.choice(TRANSACTION_TYPES, size=chunk_transactions),
+                "description": rng.choice(description_pool, size=chunk_transactions),
+                "fiscal_year": fiscal_years,
+                "fiscal_quarter": fiscal_quarters,
+                "invoice_number": np.char.add("INV-", invoice_numbers.astype(str)),
+                "approved_by": personnel_ids_arr[
+                    rng.integers(0, len(personnel_ids), size=chunk_transactions)
+                ],
+            }
+
+    if as_parquet:
+        shard_file = TRANSACTION_SHARD_FILE.format(shard_idx, "parquet")
+        _write_parquet_chunks(shard_file, transaction_chunks())
+    else:
+        shard_file = TRANSACTION_SHARD_FILE.format(shard_idx, "csv")
+        _write_csv_chunks(shard_file, transaction_chunks())
+
+    print(f"  Shard {shard_idx}: {num_transactions} transactions")
+    return shard_file
+
+
+def _submit_transaction_shards(executor, seed=None):
+    """Plan the transaction shards and submit one generate_transaction_shard task per shard"""
+    print("Generating transaction data...")
 
-        transactions_written = 0
-
-        for chunk in range(num_chunks):
-            chunk_transactions = min(chunk_size, NUM_TRANSACTIONS - transactions_written)
-
-            for _ in range(chunk_transactions):
-                transaction_id = str(uuid.uuid4())
-                contract_id = random.choice(contract_ids)
-
-                # Get contract dates to make sure transaction is within contract period
-                with open(CONTRACTS_FILE, "r", newline="") as f:
-                    reader = csv.DictReader(f)
-                    contract_data = next(
-                        (row for row in reader if row["contract_id"] == contract_id), None
-                    )
-
-                if contract_data:
-                    start_date = datetime.datetime.strptime(
-                        contract_data["start_date"], "%Y-%m-%d"
-                    )
-                    end_date = datetime.datetime.strptime(contract_data["end_date"], "%Y-%m-%d")
-
-                    # Generate transaction date within contract period
-                    transaction_date = fake.date_between(start_date=start_date, end_date=end_date)
-
-                    # Transaction amount based on contract value
-                    contract_value = float(contract_data["current_value"])
-                    max_transaction = (
-                        contract_value * 0.1
-                    )  # Max 10% of contract in one transaction
-                    amount = round(random.uniform(1000, max_transaction), 2)
-
-                    transaction_type = random.choice(TRANSACTION_TYPES)
-                    description = fake.sentence()
-
-                    # Calculate fiscal year and quarter (assuming Oct 1 start)
-                    fiscal_year = (
-                        transaction_date.year
-                        if transaction_date.month >= 10
-                        else transaction_date.year - 1
-                    )
-                    if transaction_date.month in (10, 11, 12):
-                        fiscal_quarter = 1
-                    elif transaction_date.month in (1, 2, 3):
-                        fiscal_quarter = 2
-                    elif transaction_date.month in (4, 5, 6):
-                        fiscal_quarter = 3
-                    else:
-                        fiscal_quarter = 4
-
-                    invoice_number = f"INV-{random.randint(10000, 99999)}"
-                    approved_by = personnel_ids[random.randint(0, len(personnel_ids) - 1)]
-
-                    writer.writerow(
-                        [
-                            transaction_id,
-                            contract_id,
-                            transaction_date.strftime("%Y-%m-%d"),
-                            f"{amount:.2f}",
-                            transaction_type,
-                            description,
-                            fiscal_year,
-                            fiscal_quarter,
-                            invoice_number,
-                            approved_by,
-                        ]
-                    )
-
-            transactions_written += chunk_transactions
-            print(f"  Progress: {transactions_written}/{NUM_TRANSACTIONS} transactions")
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    plan_seed, *shard_seeds = seed.spawn(NUM_TRANSACTION_SHARDS + 1)
+
+    # Pick every transaction's contract here, uniformly over all contracts, and hand each
+    # shard the transactions of its contracts. Ids follow the draw order rather than the
+    # shard, so an id range says nothing about which contracts it covers.
+    plan_rng = np.random.default_rng(plan_seed)
+    contract_idx = plan_rng.integers(0, NUM_CONTRACTS, size=NUM_TRANSACTIONS)
+    transaction_shards = contract_idx % NUM_TRANSACTION_SHARDS
+
+    # Descriptions are flavor text, so sample them from a pool instead of calling Faker per
+    # row. Every shard shares the one pool, so a description says nothing about the shard.
+    fake.seed_instance(int(plan_rng.integers(2**63)))
+    description_pool = _faker_pool(fake.sentence)
+
+    # Decide the format here: workers started by spawn or forkserver re-import the module and
+    # would not see a TRANSACTIONS_FORMAT set at runtime
+    as_parquet = _transactions_as_parquet()
+
+    futures = []
+    for shard_idx, shard_seed in enumerate(shard_seeds):
+        rows = np.flatnonzero(transaction_shards == shard_idx)
+        futures.append(
+            executor.submit(
+                generate_transaction_shard,
+                shard_idx,
+                rows + 1,
+                contract_idx[rows],
+                description_pool,
+                as_parquet,
+                shard_seed,
+            )
+        )
+    return futures
+
+
+def _merge_transaction_shards(futures):
+    """Combine the shard files written by the futures into the transactions Parquet or CSV file"""
+    # Only merge the files this run wrote, never leftovers from an interrupted run
+    shard_files = [future.result() for future in futures]
+
+    # Merge in the format the shards were written in. Each shard is in transaction id
+    # order, so interleave them back into a single id-ordered file.
+    if shard_files[0].endswith(".parquet"):
+        table = pa.concat_tables([pq.read_table(shard_file) for shard_file in shard_files])
+        _write_parquet_chunks(TRANSACTIONS_PARQUET_FILE, [table.sort_by("transaction_id")])
+    else:
+        with contextlib.ExitStack() as stack:
+            shards = [stack.enter_context(open(shard_file, "rb")) for shard_file in shard_files]
+            out = stack.enter_context(_open_output(TRANSACTIONS_FILE, binary=True))
+            # Keep the header from the first shard only
+            out.write(shards[0].readline())
+            for shard in shards[1:]:
+                shard.readline()
+            # Rows start with their zero-padded id, so comparing lines compares ids
+            out.writelines(heapq.merge(*shards))
+
+    for shard_file in shard_files:
+        os.remove(shard_file)
 
     print(f"✅ Generated {NUM_TRANSACTIONS} transactions")
 
 
-def generate_modifications():
+def generate_transactions(seed=None, max_workers=None):
+    """Generate financial transaction data"""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        _merge_transaction_shards(_submit_transaction_shards(executor, seed))
+
+
+def generate_modifications(seed=None):
     """Generate contract modification data"""
     print("Generating contract modification data...")
 
-    with open(MODIFICATIONS_FILE, "w", newline="") as csvfile:
+    rng = _seed_generators(seed)
+    _load_contract_index()
+    contract_values_arr, start_ords_arr, end_ords_arr = _contract_columns()
+
+    # Draw the random columns for every modification at once
+    contract_idx = rng.integers(0, NUM_CONTRACTS, size=NUM_MODIFICATIONS)
+    # Modification date during contract period, as date ordinals
+    mod_ords = rng.integers(start_ords_arr[contract_idx], end_ords_arr[contract_idx] + 1)
+    mod_types = rng.choice(MODIFICATION_TYPES, size=NUM_MODIFICATIONS)
+    statuses = rng.choice(["Approved", "Pending", "Rejected", "In Review"], size=NUM_MODIFICATIONS)
+    approver_idx = rng.integers(0, len(personnel_ids), size=NUM_MODIFICATIONS)
+
+    # Value change could be positive or negative
+    contract_value_col = contract_values_arr[contract_idx]
+    value_changes = np.where(
+        np.isin(mod_types, ["Funding", "Scope Change", "Extension"]),
+        rng.uniform(-0.2 * contract_value_col, 0.3 * contract_value_col),
+        0.0,
+    )
+    value_change_strs = np.char.mod("%.2f", value_changes)
+
+    # Schedule change in days
+    days_changes = np.where(
+        np.isin(mod_types, ["Schedule", "Extension"]),
+        rng.integers(-30, 181, size=NUM_MODIFICATIONS),
+        0,
+    )
+
+    with _open_output(MODIFICATIONS_FILE) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(
             [
@@ -446,72 +755,71 @@ def generate_modifications():
             ]
         )
 
+        batch = []
+
         for i in range(NUM_MODIFICATIONS):
             modification_id = f"MOD-{i+1:06d}"
-            contract_id = random.choice(contract_ids)
+            contract_id = contract_ids[contract_idx[i]]
             mod_number = f"P{random.randint(0, 9)}{random.randint(10, 99)}"
 
-            # Get contract dates
-            with open(CONTRACTS_FILE, "r", newline="") as f:
-                reader = csv.DictReader(f)
-                contract_data = next(
-                    (row for row in reader if row["contract_id"] == contract_id), None
-                )
+            mod_date = datetime.date.fromordinal(int(mod_ords[i])).isoformat()
+            mod_type = mod_types[i]
+            description = fake.paragraph(nb_sentences=1)
+            value_change = value_change_strs[i]
+            days_change = days_changes[i]
+            approved_by = personnel_ids[approver_idx[i]]
+            status = statuses[i]
 
-            if contract_data:
-                start_date = datetime.datetime.strptime(contract_data["start_date"], "%Y-%m-%d")
-                end_date = datetime.datetime.strptime(contract_data["end_date"], "%Y-%m-%d")
-
-                # Modification date during contract period
-                mod_date = fake.date_between(start_date=start_date, end_date=end_date)
-
-                mod_type = random.choice(MODIFICATION_TYPES)
-                description = fake.paragraph(nb_sentences=1)
-
-                # Value change could be positive or negative
-                contract_value = float(contract_data["current_value"])
-                if mod_type in ["Funding", "Scope Change", "Extension"]:
-                    value_change = round(
-                        random.uniform(-0.2 * contract_value, 0.3 * contract_value), 2
-                    )
-                else:
-                    value_change = 0.0
-
-                # Schedule change in days
-                if mod_type in ["Schedule", "Extension"]:
-                    days_change = random.randint(-30, 180)
-                else:
-                    days_change = 0
-
-                approved_by = personnel_ids[random.randint(0, len(personnel_ids) - 1)]
-                status = random.choice(["Approved", "Pending", "Rejected", "In Review"])
-
-                writer.writerow(
-                    [
-                        modification_id,
-                        contract_id,
-                        mod_number,
-                        mod_date.strftime("%Y-%m-%d"),
-                        mod_type,
-                        description,
-                        f"{value_change:.2f}",
-                        days_change,
-                        approved_by,
-                        status,
-                    ]
-                )
+            batch.append(
+                [
+                    modification_id,
+                    contract_id,
+                    mod_number,
+                    mod_date,
+                    mod_type,
+                    description,
+                    value_change,
+                    days_change,
+                    approved_by,
+                    status,
+                ]
+            )
+            if len(batch) >= WRITE_BATCH_SIZE:
+                writer.writerows(batch)
+                batch.clear()
 
             if (i + 1) % 500 == 0:
                 print(f"  Progress: {i + 1}/{NUM_MODIFICATIONS} modifications")
 
+        writer.writerows(batch)
+
     print(f"✅ Generated {NUM_MODIFICATIONS} contract modifications")
 
 
-def generate_deliverables():
+def generate_deliverables(seed=None):
     """Generate contract deliverable data"""
     print("Generating contract deliverable data...")
 
-    with open(DELIVERABLES_FILE, "w", newline="") as csvfile:
+    rng = _seed_generators(seed)
+    _load_contract_index()
+
+    _, start_ords_arr, end_ords_arr = _contract_columns()
+
+    # Draw the random columns for every deliverable at once
+    contract_idx = rng.integers(0, NUM_CONTRACTS, size=NUM_DELIVERABLES)
+    # Deliverable due date during contract period, as date ordinals
+    due_ords = rng.integers(start_ords_arr[contract_idx], end_ords_arr[contract_idx] + 1)
+    deliverable_types = rng.choice(DELIVERABLE_TYPES, size=NUM_DELIVERABLES)
+    statuses = rng.choice(
+        ["Pending", "Delivered", "Accepted", "Rejected", "Delayed"], size=NUM_DELIVERABLES
+    )
+    reviewer_idx = rng.integers(0, len(personnel_ids), size=NUM_DELIVERABLES)
+
+    # Title and description flavor text sampled from pools
+    titles = rng.choice(_faker_pool(fake.bs), size=NUM_DELIVERABLES)
+    descriptions = rng.choice(_faker_pool(fake.paragraph, nb_sentences=2), size=NUM_DELIVERABLES)
+
+    with _open_output(DELIVERABLES_FILE) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(
             [
@@ -528,79 +836,71 @@ def generate_deliverables():
             ]
         )
 
+        batch = []
+
         for i in range(NUM_DELIVERABLES):
             deliverable_id = f"DEL-{i+1:06d}"
-            contract_id = random.choice(contract_ids)
+            contract_id = contract_ids[contract_idx[i]]
 
-            # Get contract dates
-            with open(CONTRACTS_FILE, "r", newline="") as f:
-                reader = csv.DictReader(f)
-                contract_data = next(
-                    (row for row in reader if row["contract_id"] == contract_id), None
-                )
+            due_ord = int(due_ords[i])
+
+            title = f"Deliverable {titles[i]}"
+            deliverable_type = deliverable_types[i]
+            description = descriptions[i]
+
+            # Status and delivery date
+            status = statuses[i]
 
-            if contract_data:
-                start_date = datetime.datetime.strptime(contract_data["start_date"], "%Y-%m-%d")
-                end_date = datetime.datetime.strptime(contract_data["end_date"], "%Y-%m-%d")
-
-                # Deliverable due date during contract period
-                due_date = fake.date_between(start_date=start_date, end_date=end_date)
-
-                # Title and description
-                title = f"Deliverable {fake.bs()}"
-                deliverable_type = random.choice(DELIVERABLE_TYPES)
-                description = fake.paragraph(nb_sentences=2)
-
-                # Status and delivery date
-                status_options = ["Pending", "Delivered", "Accepted", "Rejected", "Delayed"]
-                status = random.choice(status_options)
-
-                if status in ["Delivered", "Accepted", "Rejected"]:
-                    # Delivery date - most on time, some late, few early
-                    days_offset = random.choices(
-                        [-10, -5, 0, 3, 7, 15, 30], weights=[5, 10, 60, 10, 8, 5, 2], k=1
-                    )[0]
-                    delivery_date = due_date + datetime.timedelta(days=days_offset)
-                    delivery_date = delivery_date.strftime("%Y-%m-%d")
-
-                    # For delivered items, set accepted status
-                    accepted = (
-                        random.choices(["Yes", "No", "Conditional"], weights=[80, 15, 5], k=1)[0]
-                        if status == "Delivered"
-                        else "N/A"
-                    )
-                else:
-                    delivery_date = ""
-                    accepted = "N/A"
-
-                reviewer = personnel_ids[random.randint(0, len(personnel_ids) - 1)]
-
-                writer.writerow(
-                    [
-                        deliverable_id,
-                        contract_id,
-                        title,
-                        deliverable_type,
-                        due_date.strftime("%Y-%m-%d"),
-                        delivery_date,
-                        status,
-                        description,
-                        accepted,
-                        reviewer,
-                    ]
+            if status in ["Delivered", "Accepted", "Rejected"]:
+                # Delivery date - most on time, some late, few early
+                days_offset = _weighted_choice(DELIVERY_OFFSETS, DELIVERY_OFFSET_CUM)
+                delivery_date = datetime.date.fromordinal(due_ord + days_offset).isoformat()
+
+                # For delivered items, set accepted status
+                accepted = (
+                    _weighted_choice(ACCEPTANCE_OPTIONS, ACCEPTANCE_CUM)
+                    if status == "Delivered"
+                    else "N/A"
                 )
+            else:
+                delivery_date = ""
+                accepted = "N/A"
+
+            reviewer = personnel_ids[reviewer_idx[i]]
+
+            batch.append(
+                [
+                    deliverable_id,
+                    contract_id,
+                    title,
+                    deliverable_type,
+                    datetime.date.fromordinal(due_ord).isoformat(),
+                    delivery_date,
+                    status,
+                    description,
+                    accepted,
+                    reviewer,
+                ]
+            )
+            if len(batch) >= WRITE_BATCH_SIZE:
+                writer.writerows(batch)
+                batch.clear()
 
             if (i + 1) % 1000 == 0:
                 print(f"  Progress: {i + 1}/{NUM_DELIVERABLES} deliverables")
 
+        writer.writerows(batch)
+
     print(f"✅ Generated {NUM_DELIVERABLES} contract deliverables")
 
 
-def generate_personnel():
+def generate_personnel(seed=None):
     """Generate personnel data"""
     print("Generating personnel data...")
 
-    with open(PERSONNEL_FILE, "w", newline="") as csvfile:
+    _seed_generators(seed)
+
+    with open(PERSONNEL_FILE, "w", newline="", buffering=WRITE_BUFFER_SIZE) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(
             [
@@ -616,28 +916,29 @@ def generate_personnel():
             ]
         )
 
+        batch = []
+
         # Generate 1000 personnel records
-        for personnel_id in personnel_ids:
+        for i, personnel_id in enumerate(personnel_ids):
             name = fake.name()
             role = random.choice(PERSONNEL_ROLES)
             department = random.choice(DEPARTMENTS)
             email = fake.email()
             phone = fake.phone_number()
-            security_clearance = random.choice(
-                ["Secret", "Top Secret", "TS/SCI", "Confidential", "Public Trust"]
-            )
-            hire_date = fake.date_between(start_date="-20y", end_date="today").strftime("%Y-%m-%d")
+            security_clearance = random.choice(SECURITY_CLEARANCES)
+            hire_date = fake.date_between(start_date="-20y", end_date="today").isoformat()
 
             # Some personnel are supervisors
             if random.random() < 0.8:  # 80% have a supervisor
-                supervisor = personnel_ids[random.randint(0, len(personnel_ids) - 1)]
-                # Avoid self-supervision
-                while supervisor == personnel_id:
-                    supervisor = personnel_ids[random.randint(0, len(personnel_ids) - 1)]
+                # Avoid self-supervision: draw from everyone else by skipping over our own index
+                j = random.randint(0, len(personnel_ids) - 2)
+                if j >= i:
+                    j += 1
+                supervisor = personnel_ids[j]
             else:
                 supervisor = ""
 
-            writer.writerow(
+            batch.append(
                 [
                     personnel_id,
                     name,
@@ -650,22 +951,47 @@ def generate_personnel():
                     supervisor,
                 ]
             )
+            if len(batch) >= WRITE_BATCH_SIZE:
+                writer.writerows(batch)
+                batch.clear()
+
+        writer.writerows(batch)
 
     print(f"✅ Generated {len(personnel_ids)} personnel records")
 
 
-def generate_contract_data():
+def generate_contract_data(seed=None, max_workers=None):
     """Generate all defense contract financial datasets"""
     print("Starting defense contract financial data generation...")
 
-    # Generate all datasets
-    generate_contracts()
-    generate_vendors()
-    generate_projects()
-    generate_transactions()
-    generate_modifications()
-    generate_deliverables()
-    generate_personnel()
+    # One independent seed per generator so parallel runs stay reproducible
+    contracts_seed, transactions_seed, *worker_seeds = np.random.SeedSequence(seed).spawn(7)
+
+    # Stage 1: contracts, which the transaction, modification and deliverable data key off
+    generate_contracts(contracts_seed)
+
+    # Stage 2: everything else is independent and writes its own file; transactions are
+    # split into shards that run alongside the other generators
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(generator, worker_seed)
+            for generator, worker_seed in zip(
+                [
+                    # Pass PRETTY_JSON along: workers started by spawn or forkserver
+                    # re-import the module and would not see a value set at runtime
+                    functools.partial(generate_vendors, pretty_json=PRETTY_JSON),
+                    generate_projects,
+                    generate_modifications,
+                    generate_deliverables,
+                    generate_personnel,
+                ],
+                worker_seeds,
+            )
+        ]
+        _merge_transaction_shards(_submit_transaction_shards(executor, transactions_seed))
+
+        for future in futures:
+            future.result()
 
     print("\nData generation complete! Files are in the 'data/raw' directory.")
     print("Summary:")